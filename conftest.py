@@ -1,29 +1,62 @@
 # Pytest fixtures and configuration
+import os
+import pickle
 import pytest
 import yaml
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as Loader
+except ImportError:
+    from yaml import SafeLoader as Loader
+
+
+def _load_yaml_cached(request, path):
+    """Load a YAML file, reusing a pickled copy from pytest's cache dir across runs."""
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        with open(path, 'r') as f:
+            return yaml.load(f, Loader=Loader)
+    
+    # Pickle round-trips every YAML value exactly (int keys, dates, ...), unlike
+    # the JSON-backed cache.get/set; entries are keyed on the file's mtime
+    mtime_ns = path.stat().st_mtime_ns
+    cache_file = cache.mkdir("ai-threat-analytics-yaml") / f"{path.name}.pickle"
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_mtime_ns, data = pickle.load(f)
+        if cached_mtime_ns == mtime_ns:
+            return data
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        # Missing or unreadable entries are simply rebuilt
+        pass
+    
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=Loader)
+    
+    # Write then rename so parallel workers never read a partial entry
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    with open(tmp_file, 'wb') as f:
+        pickle.dump((mtime_ns, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, cache_file)
+    
+    return data
+
 
 @pytest.fixture(scope="session")
-def config():
+def config(request):
     """Load configuration for tests."""
     config_path = Path(__file__).parent / "config" / "settings.yaml"
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-    
-    return config
+    return _load_yaml_cached(request, config_path)
 
 
 @pytest.fixture(scope="session")
-def test_data():
+def test_data(request):
     """Load test data."""
     data_path = Path(__file__).parent / "config" / "test_data" / "sample_data.yaml"
     
-    with open(data_path, 'r') as f:
-        data = yaml.safe_load(f)
-    
-    return data
+    return _load_yaml_cached(request, data_path)
 
 
 @pytest.fixture
@@ -5,6 +5,7 @@ from .logger import get_logger, log_metric, log_test_result
 from .metrics import (
     compute_classification_metrics,
     semantic_similarity,
+    semantic_similarity_batch,
     rouge_score,
     bleu_score
 )
@@ -29,6 +30,7 @@ __all__ = [
     'log_test_result',
     'compute_classification_metrics',
     'semantic_similarity',
+    'semantic_similarity_batch',
     'rouge_score',
     'bleu_score',
     'detect_anomalies',
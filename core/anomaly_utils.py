@@ -1,4 +1,4 @@
-import statistics
+import numpy as np
 
 
 def detect_anomalies(data, threshold=2.0):
@@ -15,13 +15,12 @@ def detect_anomalies(data, threshold=2.0):
     if len(data) < 2:
         return []
     
-    mean = statistics.mean(data)
-    stdev = statistics.stdev(data)
+    values = np.asarray(data, dtype=np.float64)
+    mean = values.mean()
+    stdev = values.std(ddof=1)
     
-    anomalies = []
-    for i, value in enumerate(data):
-        z_score = abs((value - mean) / stdev) if stdev > 0 else 0
-        if z_score > threshold:
-            anomalies.append(i)
+    if stdev == 0:
+        return []
     
-    return anomalies
\ No newline at end of file
+    z_scores = np.abs(values - mean) / stdev
+    return np.flatnonzero(z_scores > threshold).tolist()
@@ -3,18 +3,27 @@
 API Client for AI/ML services with Zero-Trust security headers.
 Handles authentication, request formatting, and response validation.
 """
-import requests
 import json
+import logging
+import requests
+import orjson
 from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .helpers import dump_json, load_json
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Transient statuses retried at the transport layer before reaching callers
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
 
 class APIClient:
     """HTTPS client with authentication and zero-trust headers."""
     
-    def __init__(self, base_url: str, token: str, timeout: int = 20):
+    def __init__(self, base_url: str, token: str, timeout: int = 20,
+                 max_retries: int = 3, pool_maxsize: int = 32):
         """
         Initialize API client.
         
@@ -22,6 +31,8 @@ class APIClient:
             base_url: Base URL for API endpoints
             token: Authentication token
             timeout: Request timeout in seconds
+            max_retries: Retries for connection errors and transient HTTP statuses
+            pool_maxsize: Maximum pooled connections kept per host
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
@@ -31,42 +42,101 @@ class APIClient:
             "X-Zero-Trust": "enabled",
             "X-Client-Version": "1.0.0"
         }
+        
+        # Persistent session so repeated calls reuse pooled keep-alive connections;
+        # headers are sent per request so later changes to self.headers apply
+        self._session = requests.Session()
+        
+        # Back off on 429/5xx (honouring Retry-After); once retries are used up
+        # the last response is returned so raise_for_status still raises HTTPError
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.3,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         logger.info(f"APIClient initialized for {self.base_url}")
 
-    def post(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "APIClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _request(self, method: str, endpoint: str, payload: Optional[Dict[str, Any]] = None,
+                 params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        Send POST request to endpoint.
+        Send a request through the pooled session and decode the JSON response.
         
         Args:
+            method: HTTP method
             endpoint: API endpoint path
-            payload: Request payload dictionary
+            payload: Optional request payload dictionary
+            params: Optional query parameters
             
         Returns:
-            Response JSON as dictionary
+            Response JSON as dictionary, or an empty dictionary for empty bodies
             
         Raises:
             requests.HTTPError: On HTTP error responses
+            requests.JSONDecodeError: If the response body is not valid JSON
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.info(f"POST {url}")
-        logger.debug(f"Payload: {json.dumps(payload, indent=2)}")
+        logger.info("%s %s", method, url)
+        
+        data = None
+        if payload is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Payload: %s", dump_json(payload, option=orjson.OPT_INDENT_2).decode())
+            data = dump_json(payload)
         
         try:
-            resp = requests.post(
+            resp = self._session.request(
+                method,
                 url,
                 headers=self.headers,
-                data=json.dumps(payload),
+                data=data,
+                params=params,
                 timeout=self.timeout
             )
             resp.raise_for_status()
-            response_data = resp.json()
-            logger.info(f"Response status: {resp.status_code}")
-            return response_data
+            logger.info("Response status: %s", resp.status_code)
+            
+            try:
+                return load_json(resp.content) if resp.content else {}
+            except json.JSONDecodeError as e:
+                # Surface bad bodies as requests' own (RequestException) decode error
+                raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos, response=resp) from e
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {str(e)}")
+            logger.error("Request failed: %s", e)
             raise
 
+    def post(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send POST request to endpoint.
+        
+        Args:
+            endpoint: API endpoint path
+            payload: Request payload dictionary
+            
+        Returns:
+            Response JSON as dictionary
+            
+        Raises:
+            requests.HTTPError: On HTTP error responses
+        """
+        return self._request("POST", endpoint, payload=payload)
+
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Send GET request to endpoint.
@@ -78,61 +148,15 @@ class APIClient:
         Returns:
             Response JSON as dictionary
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.info(f"GET {url}")
-        
-        try:
-            resp = requests.get(
-                url,
-                headers=self.headers,
-                params=params,
-                timeout=self.timeout
-            )
-            resp.raise_for_status()
-            response_data = resp.json()
-            logger.info(f"Response status: {resp.status_code}")
-            return response_data
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {str(e)}")
-            raise
+        return self._request("GET", endpoint, params=params)
 
     def put(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Send PUT request to endpoint."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.info(f"PUT {url}")
-        
-        try:
-            resp = requests.put(
-                url,
-                headers=self.headers,
-                data=json.dumps(payload),
-                timeout=self.timeout
-            )
-            resp.raise_for_status()
-            return resp.json()
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {str(e)}")
-            raise
+        return self._request("PUT", endpoint, payload=payload)
 
     def delete(self, endpoint: str) -> Dict[str, Any]:
         """Send DELETE request to endpoint."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.info(f"DELETE {url}")
-        
-        try:
-            resp = requests.delete(
-                url,
-                headers=self.headers,
-                timeout=self.timeout
-            )
-            resp.raise_for_status()
-            return resp.json() if resp.content else {}
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {str(e)}")
-            raise
+        return self._request("DELETE", endpoint)
         
     def autofill_suggest(self, data):
         """
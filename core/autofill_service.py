@@ -1,27 +1,35 @@
+from typing import ClassVar, Dict, Tuple
+
+
 class AutofillService:
     """AI-powered autofill suggestions"""
     
+    __slots__ = ()
+    
+    # Suggestion templates per field type, formatted with the context on demand
+    _TEMPLATES: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        'email': (
+            '{context}@gmail.com',
+            '{context}@company.com',
+            '{context}@outlook.com'
+        ),
+        'phone': (
+            '{context}-0000',
+            '{context}-1234',
+            '{context}-5678'
+        ),
+        'address': (
+            '{context} Street, New York',
+            '{context} Avenue, Boston',
+            '{context} Road, Seattle'
+        )
+    }
+    
     def suggest(self, field, context):
         """Generate autofill suggestions based on field type and context"""
-        suggestions = {
-            'email': [
-                f"{context}@gmail.com",
-                f"{context}@company.com",
-                f"{context}@outlook.com"
-            ],
-            'phone': [
-                f"{context}-0000",
-                f"{context}-1234",
-                f"{context}-5678"
-            ],
-            'address': [
-                f"{context} Street, New York",
-                f"{context} Avenue, Boston",
-                f"{context} Road, Seattle"
-            ]
-        }
+        templates = self._TEMPLATES.get(field, ())
         
         return {
-            'suggestions': suggestions.get(field, []),
+            'suggestions': [template.format(context=context) for template in templates],
             'confidence': 0.85
         }
\ No newline at end of file
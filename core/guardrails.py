@@ -1,67 +1,86 @@
 import re
+from typing import ClassVar, Optional, Pattern, Tuple
+
+from .regex_backend import ScanPattern, ascii_engine_compatible
+
+try:
+    import hyperscan
+except ImportError:  # Optional DFA backend, fall back to the re patterns below
+    hyperscan = None
+
+
+def _compile_threat_database(categories):
+    """Compile all threat categories into one Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.pattern.encode() for _, pattern in categories],
+            ids=list(range(len(categories))),
+            elements=len(categories),
+            flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+        )
+    except hyperscan.error:
+        return None
+
+    return database
 
 
 class LLMGuardrails:
     """Real LLM security guardrails"""
-    
+
+    # Stateless: all pattern tables below are built once at import and shared
+    __slots__ = ()
+
+    # Threat patterns, one alternation per category so each check is a single scan
+    _THREAT_CATEGORIES: ClassVar[Tuple[Tuple[str, Pattern], ...]] = (
+        ('prompt_injection', re.compile(
+            r'ignore\s+(?:previous|all)\s+instructions'
+            r'|disregard\s+all\s+rules'
+            r'|reveal\s+system\s+prompt',
+            re.IGNORECASE
+        )),
+        ('code_injection', re.compile(r'<script.*?>|javascript:|onerror=', re.IGNORECASE)),
+        ('sql_injection', re.compile(r"'.*OR.*=|DROP\s+TABLE|;\s*DELETE", re.IGNORECASE)),
+    )
+    _THREAT_DATABASE: ClassVar[Optional["hyperscan.Database"]] = _compile_threat_database(_THREAT_CATEGORIES)
+
+    # PII patterns, named by redaction label so one pass handles all of them;
+    # scanned with RE2 when available and in agreement with re
+    _PII_RE: ClassVar[ScanPattern] = ScanPattern(
+        r'(?P<EMAIL>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+        r'|(?P<SSN>\b\d{3}-\d{2}-\d{4}\b)'
+        r'|(?P<PHONE>\b\d{3}-\d{3}-\d{4}\b)'
+    )
+
     def validate_input(self, text):
         """Validate user input for security threats"""
-        threats = []
-        
-        # Check for prompt injection
-        prompt_patterns = [
-            r'ignore\s+(previous|all)\s+instructions',
-            r'disregard\s+all\s+rules',
-            r'reveal\s+system\s+prompt'
-        ]
-        for pattern in prompt_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                threats.append('prompt_injection')
-                break
-        
-        # Check for code injection
-        code_patterns = [r'<script.*?>', r'javascript:', r'onerror=']
-        for pattern in code_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                threats.append('code_injection')
-                break
-        
-        # Check for SQL injection
-        sql_patterns = [r"'.*OR.*=", r'DROP\s+TABLE', r';\s*DELETE']
-        for pattern in sql_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                threats.append('sql_injection')
-                break
-        
+        # Hyperscan matches bytes with ASCII classes, so only input it scans exactly
+        # like re goes through it; anything else keeps the Unicode-aware patterns
+        if self._THREAT_DATABASE is not None and ascii_engine_compatible(text):
+            # Single DFA pass over the input reporting every category that fired
+            matched = set()
+
+            def on_match(pattern_id, start, end, flags, context):
+                matched.add(pattern_id)
+
+            self._THREAT_DATABASE.scan(text.encode(), match_event_handler=on_match)
+            threats = [name for i, (name, _) in enumerate(self._THREAT_CATEGORIES) if i in matched]
+        else:
+            threats = [name for name, pattern in self._THREAT_CATEGORIES if pattern.search(text)]
+
         return {
             'is_safe': len(threats) == 0,
             'threats_detected': threats
         }
-    
+
     def sanitize_output(self, text):
         """Remove PII from output"""
-        # Email pattern
-        text = re.sub(
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            '[EMAIL_REDACTED]',
-            text
-        )
-        
-        # SSN pattern
-        text = re.sub(
-            r'\b\d{3}-\d{2}-\d{4}\b',
-            '[SSN_REDACTED]',
-            text
-        )
-        
-        # Phone pattern
-        text = re.sub(
-            r'\b\d{3}-\d{3}-\d{4}\b',
-            '[PHONE_REDACTED]',
-            text
-        )
-        
+        text = self._PII_RE.sub(lambda match: f'[{match.lastgroup}_REDACTED]', text)
+
         return {
             'sanitized_text': text,
             'pii_removed': '[REDACTED]' in text
-        }
\ No newline at end of file
+        }
@@ -2,11 +2,51 @@
 """
 Helper utilities for parsing, normalization, and fuzzy comparison.
 """
-import re
 import json
-from typing import Any, Dict, List, Optional, Tuple
-from difflib import SequenceMatcher
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+import numpy as np
+import orjson
+from rapidfuzz import fuzz, process
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso8601
+except ImportError:  # Optional C parser, fall back to datetime.fromisoformat
+    _parse_iso8601 = datetime.fromisoformat
+
+
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+# Same mapping as _NON_WORD_RE for ASCII, applied in one str.translate pass
+_ASCII_PUNCT_TABLE = str.maketrans({c: ' ' for c in map(chr, range(128)) if _NON_WORD_RE.match(c)})
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Accept NumPy values and non-str keys when encoding, like the stdlib json encoder
+_JSON_DUMP_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+# orjson turns integers beyond 64 bits into floats, so documents with digit runs
+# this long are decoded by the stdlib json module to keep them exact
+_LONG_INTEGER_RE = re.compile(r'\d{19}')
+_LONG_INTEGER_BYTES_RE = re.compile(rb'\d{19}')
+
+# Shapes the ISO-8601 fast path may parse: exactly the strptime formats below
+# with zero-padded fields, so results never gain a timezone or a new format
+# (hours stop at 23: ciso8601 would roll "24:00:00" over to the next day)
+_FAST_TIMESTAMP_RE = re.compile(
+    r'[0-9]{4}-[0-9]{2}-[0-9]{2}'
+    r'(?: (?:[01][0-9]|2[0-3]):[0-9]{2}:[0-9]{2}'
+    r'|T(?:[01][0-9]|2[0-3]):[0-9]{2}:[0-9]{2}(?:\.[0-9]{1,6})?Z?)'
+)
+
+# strptime formats; also the fallback for anything the fast path rejects
+_TIMESTAMP_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S.%f',
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%dT%H:%M:%S.%fZ',
+)
 
 
 def normalize_text(text: str, lowercase: bool = True, remove_punctuation: bool = False) -> str:
@@ -25,12 +65,13 @@ def normalize_text(text: str, lowercase: bool = True, remove_punctuation: bool =
         text = text.lower()
     
     if remove_punctuation:
-        text = re.sub(r'[^\w\s]', ' ', text)
+        if text.isascii():
+            text = text.translate(_ASCII_PUNCT_TABLE)
+        else:
+            text = _NON_WORD_RE.sub(' ', text)
     
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    
-    return text
+    return ' '.join(text.split())
 
 
 def fuzzy_match(str1: str, str2: str, threshold: float = 0.8) -> bool:
@@ -45,10 +86,12 @@ def fuzzy_match(str1: str, str2: str, threshold: float = 0.8) -> bool:
     Returns:
         True if strings match above threshold
     """
-    ratio = SequenceMatcher(None, str1, str2).ratio()
-    return ratio >= threshold
+    # With a cutoff the scorer bails out early and returns 0 below it
+    cutoff = threshold * 100
+    return fuzz.ratio(str1, str2, score_cutoff=cutoff) >= cutoff
 
 
+@lru_cache(maxsize=4096)
 def fuzzy_similarity(str1: str, str2: str) -> float:
     """
     Calculate fuzzy similarity between strings.
@@ -60,26 +103,100 @@ def fuzzy_similarity(str1: str, str2: str) -> float:
     Returns:
         Similarity ratio (0-1)
     """
-    return SequenceMatcher(None, str1, str2).ratio()
+    return fuzz.ratio(str1, str2) / 100.0
+
+
+def fuzzy_match_batch(queries: List[str], choices: List[str], threshold: float = 0.8) -> np.ndarray:
+    """
+    Perform fuzzy matching of every query against every choice.
+    
+    Args:
+        queries: Strings to match
+        choices: Candidate strings to match against
+        threshold: Similarity threshold (0-1)
+        
+    Returns:
+        Boolean matrix of shape (len(queries), len(choices))
+    """
+    # Full float64 scores compared here rather than a cdist score_cutoff: cdist
+    # applies the cutoff to a rounded distance, so pairs sitting exactly on the
+    # threshold would disagree with fuzzy_match
+    scores = process.cdist(queries, choices, scorer=fuzz.ratio, dtype=np.float64)
+    return scores >= threshold * 100
 
 
-def parse_json_safe(text: str, default: Any = None) -> Any:
+def parse_json_safe(text: Union[str, bytes], default: Any = None) -> Any:
     """
     Safely parse JSON, returning default on error.
     
     Args:
-        text: JSON text
+        text: JSON text or UTF-8 encoded bytes
         default: Default value on parse error
         
     Returns:
         Parsed JSON or default value
     """
     try:
-        return json.loads(text)
-    except (json.JSONDecodeError, TypeError):
+        return load_json(text)
+    except (ValueError, TypeError):
         return default
 
 
+def _json_default(obj: Any) -> Any:
+    """Convert values orjson/json cannot serialize natively to Python objects."""
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    if isinstance(obj, datetime):
+        # Only reached on the stdlib fallback; orjson encodes datetimes itself
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dump_json(obj: Any, option: int = 0) -> bytes:
+    """
+    Serialize an object to JSON.
+    
+    Args:
+        obj: Object to serialize; NumPy values and non-str dict keys are accepted
+        option: Extra orjson option flags (e.g. orjson.OPT_INDENT_2)
+        
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    try:
+        return orjson.dumps(obj, default=_json_default, option=_JSON_DUMP_OPTIONS | option)
+    except orjson.JSONEncodeError:
+        # orjson rejects values such as integers beyond 64 bits; the stdlib
+        # encoder handles those and raises TypeError for truly unsupported types
+        if option & orjson.OPT_INDENT_2:
+            return json.dumps(obj, default=_json_default, indent=2).encode()
+        return json.dumps(obj, default=_json_default, separators=(',', ':')).encode()
+
+
+def load_json(text: Union[str, bytes]) -> Any:
+    """
+    Parse JSON with the same results as json.loads.
+    
+    Args:
+        text: JSON text or UTF-8 encoded bytes
+        
+    Returns:
+        Parsed JSON
+        
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON
+    """
+    long_integer_re = _LONG_INTEGER_BYTES_RE if isinstance(text, (bytes, bytearray)) else _LONG_INTEGER_RE
+    if long_integer_re.search(text) is None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity literals or overflowing floats, which json accepts
+            pass
+    
+    return json.loads(text)
+
+
 def extract_json_from_text(text: str) -> Optional[Dict[str, Any]]:
     """
     Extract JSON object from text containing other content.
@@ -91,7 +208,7 @@ def extract_json_from_text(text: str) -> Optional[Dict[str, Any]]:
         Extracted JSON dictionary or None
     """
     # Try to find JSON object boundaries
-    json_match = re.search(r'\{.*\}', text, re.DOTALL)
+    json_match = _JSON_OBJECT_RE.search(text)
     if json_match:
         return parse_json_safe(json_match.group(0))
     
@@ -110,17 +227,26 @@ def flatten_dict(nested_dict: Dict[str, Any], parent_key: str = '', sep: str = '
     Returns:
         Flattened dictionary
     """
-    items = []
+    flat = {}
+    # Stack of (key prefix, item iterator); descending pauses the parent so
+    # keys come out in the same depth-first order as a recursive walk
+    stack = [(parent_key, iter(nested_dict.items()))]
     
-    for key, value in nested_dict.items():
-        new_key = f"{parent_key}{sep}{key}" if parent_key else key
+    while stack:
+        prefix, items = stack[-1]
         
-        if isinstance(value, dict):
-            items.extend(flatten_dict(value, new_key, sep=sep).items())
+        for key, value in items:
+            new_key = f"{prefix}{sep}{key}" if prefix else key
+            
+            if isinstance(value, dict):
+                stack.append((new_key, iter(value.items())))
+                break
+            
+            flat[new_key] = value
         else:
-            items.append((new_key, value))
+            stack.pop()
     
-    return dict(items)
+    return flat
 
 
 def compare_dicts(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
@@ -137,18 +263,19 @@ def compare_dicts(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any
     flat1 = flatten_dict(dict1)
     flat2 = flatten_dict(dict2)
     
-    all_keys = set(flat1.keys()) | set(flat2.keys())
+    keys1, keys2 = flat1.keys(), flat2.keys()
+    common_keys = keys1 & keys2
     
-    added = {k: flat2[k] for k in flat2.keys() - flat1.keys()}
-    removed = {k: flat1[k] for k in flat1.keys() - flat2.keys()}
+    added = {k: flat2[k] for k in keys2 - keys1}
+    removed = {k: flat1[k] for k in keys1 - keys2}
     modified = {k: {'old': flat1[k], 'new': flat2[k]} 
-                for k in all_keys if k in flat1 and k in flat2 and flat1[k] != flat2[k]}
+                for k in common_keys if flat1[k] != flat2[k]}
     
     return {
         'added': added,
         'removed': removed,
         'modified': modified,
-        'unchanged_count': len(all_keys) - len(added) - len(removed) - len(modified)
+        'unchanged_count': len(common_keys) - len(modified)
     }
 
 
@@ -202,15 +329,16 @@ def parse_timestamp(timestamp_str: str) -> Optional[datetime]:
     Returns:
         Datetime object or None
     """
-    formats = [
-        '%Y-%m-%d %H:%M:%S',
-        '%Y-%m-%dT%H:%M:%S',
-        '%Y-%m-%dT%H:%M:%S.%f',
-        '%Y-%m-%dT%H:%M:%SZ',
-        '%Y-%m-%dT%H:%M:%S.%fZ',
-    ]
+    if _FAST_TIMESTAMP_RE.fullmatch(timestamp_str):
+        # A trailing "Z" is dropped so results stay naive, as with the strptime formats
+        iso_str = timestamp_str[:-1] if timestamp_str.endswith('Z') else timestamp_str
+        try:
+            return _parse_iso8601(iso_str)
+        except ValueError:
+            # e.g. fromisoformat on older Pythons rejecting 1-2 digit fractions
+            pass
     
-    for fmt in formats:
+    for fmt in _TIMESTAMP_FORMATS:
         try:
             return datetime.strptime(timestamp_str, fmt)
         except ValueError:
@@ -219,18 +347,48 @@ def parse_timestamp(timestamp_str: str) -> Optional[datetime]:
     return None
 
 
-def batch_list(items: List[Any], batch_size: int) -> List[List[Any]]:
+def batch_list(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
     """
-    Split list into batches.
+    Split items into batches lazily.
     
     Args:
-        items: List of items
+        items: Iterable of items
         batch_size: Size of each batch
         
     Returns:
-        List of batches
+        Iterator over batches; only one batch is held in memory at a time
+    """
+    # Validated here rather than in the generator so bad sizes fail at the call
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    
+    return _iter_batches(iter(items), batch_size)
+
+
+def _iter_batches(iterator: Iterator[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Yield lists of up to batch_size items until the iterator is exhausted."""
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def batch_slices(items: Sequence[Any], batch_size: int) -> Iterator[Sequence[Any]]:
     """
-    return [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    Yield consecutive slices of a sequence without building the outer list.
+    
+    Args:
+        items: Sequence of items (list, tuple, str, ...)
+        batch_size: Size of each slice
+        
+    Returns:
+        Iterator over slices of the same type as items
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    
+    return (items[i:i + batch_size] for i in range(0, len(items), batch_size))
 
 
 def retry_with_backoff(func, max_retries: int = 3, initial_delay: float = 1.0):
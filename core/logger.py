@@ -4,10 +4,15 @@ Structured logging module for ML observability.
 Supports JSON logging and integration with monitoring systems.
 """
 import logging
-import json
+import orjson
 import sys
 from datetime import datetime
 from typing import Any, Dict
+from .helpers import dump_json
+
+
+# Serialize naive utcnow() datetimes natively as ISO-8601 with a "Z" suffix
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
 
 
 class JSONFormatter(logging.Formatter):
@@ -16,7 +21,7 @@ class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.utcnow(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -33,7 +38,7 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra_data"):
             log_data["extra"] = record.extra_data
             
-        return json.dumps(log_data)
+        return dump_json(log_data, option=_ORJSON_OPTIONS).decode()
 
 
 def get_logger(name: str, level: str = "INFO", json_format: bool = False) -> logging.Logger:
@@ -88,13 +93,13 @@ def log_metric(logger: logging.Logger, metric_name: str, value: Any, metadata: D
     log_data = {
         "metric": metric_name,
         "value": value,
-        "timestamp": datetime.utcnow().isoformat() + "Z"
+        "timestamp": datetime.utcnow()
     }
     
     if metadata:
         log_data.update(metadata)
     
-    logger.info(f"METRIC: {json.dumps(log_data)}")
+    logger.info(f"METRIC: {dump_json(log_data, option=_ORJSON_OPTIONS).decode()}")
 
 
 def log_test_result(logger: logging.Logger, test_name: str, status: str, duration: float, details: Dict[str, Any] = None):
@@ -112,10 +117,10 @@ def log_test_result(logger: logging.Logger, test_name: str, status: str, duratio
         "test": test_name,
         "status": status,
         "duration_seconds": duration,
-        "timestamp": datetime.utcnow().isoformat() + "Z"
+        "timestamp": datetime.utcnow()
     }
     
     if details:
         log_data["details"] = details
     
-    logger.info(f"TEST_RESULT: {json.dumps(log_data)}")
+    logger.info(f"TEST_RESULT: {dump_json(log_data, option=_ORJSON_OPTIONS).decode()}")
@@ -6,11 +6,26 @@ Includes precision, recall, BLEU, ROUGE, and embedding similarity.
 import numpy as np
 from typing import List, Dict, Any, Tuple
 from sklearn.metrics import precision_score, recall_score, f1_score, accuracy_score
-from sklearn.metrics.pairwise import cosine_similarity
 from collections import Counter
+from functools import lru_cache
+from itertools import islice
 import re
 
 
+_WORD_RE = re.compile(r'\w+')
+_DEFAULT_EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+
+def _tokenize(text: str) -> List[str]:
+    """Lowercase word tokens shared by the overlap, ROUGE and BLEU metrics."""
+    return _WORD_RE.findall(text.lower())
+
+
+def _get_ngrams(tokens: List[str], n: int) -> Counter:
+    """Count n-grams from a token list without copying shifted slices."""
+    return Counter(zip(*(islice(tokens, i, None) for i in range(n))))
+
+
 def compute_classification_metrics(y_true: List[int], y_pred: List[int], average: str = 'weighted') -> Dict[str, float]:
     """
     Compute classification metrics.
@@ -31,6 +46,14 @@ def compute_classification_metrics(y_true: List[int], y_pred: List[int], average
     }
 
 
+@lru_cache(maxsize=None)
+def _load_embedding_model(model_name: str = _DEFAULT_EMBEDDING_MODEL):
+    """Load a sentence transformer once per process and reuse it."""
+    from sentence_transformers import SentenceTransformer
+    
+    return SentenceTransformer(model_name)
+
+
 def semantic_similarity(text1: str, text2: str, model=None) -> float:
     """
     Calculate semantic similarity between two texts using embeddings.
@@ -44,20 +67,52 @@ def semantic_similarity(text1: str, text2: str, model=None) -> float:
         Cosine similarity score (0-1)
     """
     try:
-        from sentence_transformers import SentenceTransformer
-        
         if model is None:
-            model = SentenceTransformer('all-MiniLM-L6-v2')
+            model = _load_embedding_model()
         
-        embeddings = model.encode([text1, text2])
-        similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
-        return float(similarity)
+        # Unit-length embeddings make the dot product the cosine similarity
+        embeddings = model.encode([text1, text2], normalize_embeddings=True)
+        return float(np.dot(embeddings[0], embeddings[1]))
     
     except ImportError:
         # Fallback to simple token overlap if sentence-transformers not available
         return token_overlap_similarity(text1, text2)
 
 
+def semantic_similarity_batch(pairs: List[Tuple[str, str]], model=None, batch_size: int = 64) -> np.ndarray:
+    """
+    Calculate semantic similarity for many text pairs in one encoding pass.
+    
+    Args:
+        pairs: Sequence of (text1, text2) tuples
+        model: Optional pre-loaded sentence transformer model
+        batch_size: Number of texts encoded per forward pass
+        
+    Returns:
+        Array of cosine similarity scores, one per pair
+    """
+    if not pairs:
+        return np.empty(0)
+    
+    try:
+        if model is None:
+            model = _load_embedding_model()
+        
+        # Encode both sides of every pair together so the model runs full batches
+        texts = [text for pair in pairs for text in pair]
+        embeddings = model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        return np.einsum('ij,ij->i', embeddings[0::2], embeddings[1::2])
+    
+    except ImportError:
+        # Fallback to simple token overlap if sentence-transformers not available
+        return np.array([token_overlap_similarity(text1, text2) for text1, text2 in pairs])
+
+
 def token_overlap_similarity(text1: str, text2: str) -> float:
     """
     Calculate simple token overlap similarity.
@@ -69,8 +124,8 @@ def token_overlap_similarity(text1: str, text2: str) -> float:
     Returns:
         Jaccard similarity coefficient
     """
-    tokens1 = set(re.findall(r'\w+', text1.lower()))
-    tokens2 = set(re.findall(r'\w+', text2.lower()))
+    tokens1 = set(_tokenize(text1))
+    tokens2 = set(_tokenize(text2))
     
     if not tokens1 or not tokens2:
         return 0.0
@@ -81,6 +136,32 @@ def token_overlap_similarity(text1: str, text2: str) -> float:
     return intersection / union if union > 0 else 0.0
 
 
+def _lcs_length(x: List[str], y: List[str]) -> int:
+    """
+    Calculate longest common subsequence length.
+    
+    Bit-parallel LCS (Hyyrö): each row of the DP table is packed into one
+    integer, so a row update is a handful of C-level bigint operations and
+    memory stays at O(len(x)) bits instead of a full (m+1)x(n+1) table.
+    """
+    if not x or not y:
+        return 0
+    
+    # Bitmask of positions in x for every distinct token
+    match_masks: Dict[str, int] = {}
+    for i, token in enumerate(x):
+        match_masks[token] = match_masks.get(token, 0) | (1 << i)
+    
+    full = (1 << len(x)) - 1
+    row = full
+    for token in y:
+        matches = row & match_masks.get(token, 0)
+        row = ((row + matches) | (row - matches)) & full
+    
+    # Each cleared bit marks one step of the LCS
+    return len(x) - bin(row).count('1')
+
+
 def rouge_score(reference: str, candidate: str) -> Dict[str, float]:
     """
     Calculate ROUGE scores for summarization evaluation.
@@ -92,28 +173,9 @@ def rouge_score(reference: str, candidate: str) -> Dict[str, float]:
     Returns:
         Dictionary with ROUGE-1, ROUGE-2, ROUGE-L scores
     """
-    def get_ngrams(text: str, n: int) -> Counter:
-        """Extract n-grams from text."""
-        tokens = re.findall(r'\w+', text.lower())
-        return Counter(zip(*[tokens[i:] for i in range(n)]))
-    
-    def lcs_length(x: List[str], y: List[str]) -> int:
-        """Calculate longest common subsequence length."""
-        m, n = len(x), len(y)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-        
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if x[i-1] == y[j-1]:
-                    dp[i][j] = dp[i-1][j-1] + 1
-                else:
-                    dp[i][j] = max(dp[i-1][j], dp[i][j-1])
-        
-        return dp[m][n]
-    
-    # Tokenize
-    ref_tokens = re.findall(r'\w+', reference.lower())
-    cand_tokens = re.findall(r'\w+', candidate.lower())
+    # Tokenize once, every ROUGE variant below works on these lists
+    ref_tokens = _tokenize(reference)
+    cand_tokens = _tokenize(candidate)
     
     # ROUGE-1 (unigram overlap)
     ref_unigrams = Counter(ref_tokens)
@@ -124,15 +186,15 @@ def rouge_score(reference: str, candidate: str) -> Dict[str, float]:
     rouge1_f1 = 2 * rouge1_precision * rouge1_recall / max(rouge1_precision + rouge1_recall, 0.0001)
     
     # ROUGE-2 (bigram overlap)
-    ref_bigrams = get_ngrams(reference, 2)
-    cand_bigrams = get_ngrams(candidate, 2)
+    ref_bigrams = _get_ngrams(ref_tokens, 2)
+    cand_bigrams = _get_ngrams(cand_tokens, 2)
     overlap_bigrams = sum((ref_bigrams & cand_bigrams).values())
     rouge2_precision = overlap_bigrams / max(sum(cand_bigrams.values()), 1)
     rouge2_recall = overlap_bigrams / max(sum(ref_bigrams.values()), 1)
     rouge2_f1 = 2 * rouge2_precision * rouge2_recall / max(rouge2_precision + rouge2_recall, 0.0001)
     
     # ROUGE-L (longest common subsequence)
-    lcs = lcs_length(ref_tokens, cand_tokens)
+    lcs = _lcs_length(ref_tokens, cand_tokens)
     rougel_precision = lcs / max(len(cand_tokens), 1)
     rougel_recall = lcs / max(len(ref_tokens), 1)
     rougel_f1 = 2 * rougel_precision * rougel_recall / max(rougel_precision + rougel_recall, 0.0001)
@@ -156,11 +218,8 @@ def bleu_score(reference: str, candidate: str, max_n: int = 4) -> float:
     Returns:
         BLEU score
     """
-    def get_ngrams(tokens: List[str], n: int) -> Counter:
-        return Counter(zip(*[tokens[i:] for i in range(n)]))
-    
-    ref_tokens = re.findall(r'\w+', reference.lower())
-    cand_tokens = re.findall(r'\w+', candidate.lower())
+    ref_tokens = _tokenize(reference)
+    cand_tokens = _tokenize(candidate)
     
     if not cand_tokens:
         return 0.0
@@ -168,8 +227,8 @@ def bleu_score(reference: str, candidate: str, max_n: int = 4) -> float:
     # Calculate modified precision for each n-gram order
     precisions = []
     for n in range(1, max_n + 1):
-        ref_ngrams = get_ngrams(ref_tokens, n)
-        cand_ngrams = get_ngrams(cand_tokens, n)
+        ref_ngrams = _get_ngrams(ref_tokens, n)
+        cand_ngrams = _get_ngrams(cand_tokens, n)
         
         overlap = sum((ref_ngrams & cand_ngrams).values())
         total = sum(cand_ngrams.values())
@@ -204,7 +263,11 @@ def embedding_distance(embedding1: np.ndarray, embedding2: np.ndarray, metric: s
         Distance value
     """
     if metric == 'cosine':
-        return 1 - cosine_similarity([embedding1], [embedding2])[0][0]
+        norms = np.linalg.norm(embedding1) * np.linalg.norm(embedding2)
+        # A zero vector has no direction; treat it as orthogonal like sklearn does
+        if norms == 0:
+            return 1.0
+        return 1.0 - float(np.dot(embedding1, embedding2) / norms)
     elif metric == 'euclidean':
         return float(np.linalg.norm(embedding1 - embedding2))
     elif metric == 'manhattan':
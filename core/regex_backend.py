@@ -0,0 +1,66 @@
+# core/regex_backend.py
+"""
+Regex backend selection for scanning untrusted text.
+Uses RE2's linear-time engine when installed, falling back to the stdlib re.
+"""
+import re
+from typing import Callable, Iterator, List, Optional, Union
+
+try:
+    import re2
+except ImportError:  # Optional linear-time engine, fall back to the stdlib backtracker
+    re2 = None
+
+
+# ASCII characters the stdlib treats as \s but RE2/Hyperscan do not (\v, \x1c-\x1f)
+_ASCII_ENGINE_DIVERGENT_RE = re.compile(r'[\x0b\x1c-\x1f]')
+
+
+def ascii_engine_compatible(text: str) -> bool:
+    """
+    Check whether an ASCII-class engine (RE2, Hyperscan) matches text like re.
+
+    Those engines work on encoded bytes with ASCII-only \\d, \\s and \\b, so
+    anything non-ASCII (including lone surrogates, which cannot be encoded)
+    or containing the extra whitespace re recognises must stay on re.
+    """
+    return text.isascii() and _ASCII_ENGINE_DIVERGENT_RE.search(text) is None
+
+
+class ScanPattern:
+    """Compiled pattern that scans with RE2 where it agrees with re."""
+
+    __slots__ = ('pattern', 're2_pattern')
+
+    def __init__(self, source: str):
+        """
+        Compile a pattern for both engines.
+
+        Args:
+            source: Pattern source; use inline flags such as (?i) so both
+                engines see the same options
+        """
+        self.pattern = re.compile(source)
+        self.re2_pattern = re2.compile(source) if re2 is not None else None
+
+    def select(self, text: str):
+        """Return the compiled pattern to scan text with."""
+        if self.re2_pattern is not None and ascii_engine_compatible(text):
+            return self.re2_pattern
+        return self.pattern
+
+    def search(self, text: str) -> Optional[re.Match]:
+        """Find the leftmost match in text."""
+        return self.select(text).search(text)
+
+    def finditer(self, text: str) -> Iterator[re.Match]:
+        """Iterate over non-overlapping matches in text."""
+        return self.select(text).finditer(text)
+
+    def findall(self, text: str) -> List[str]:
+        """Return the text of every non-overlapping match."""
+        return self.select(text).findall(text)
+
+    def sub(self, repl: Union[str, Callable[[re.Match], str]], text: str) -> str:
+        """Replace every non-overlapping match in text."""
+        return self.select(text).sub(repl, text)
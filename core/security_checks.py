@@ -3,21 +3,93 @@
 Security validation utilities for AI systems.
 Includes PII detection, data leakage checks, and guardrail validation.
 """
+import math
 import re
-from typing import List, Dict, Any, Tuple
-import hashlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Container, Dict, Iterable, List, Tuple
 
+from .regex_backend import ScanPattern
 
-# PII patterns
-PII_PATTERNS = {
+try:
+    import numpy as np
+except ImportError:  # Optional vectorized histogram, fall back to collections.Counter
+    np = None
+
+
+# PII pattern sources; earlier entries win when two types start at the same
+# position, so email stays ahead of the digit patterns it may contain. API keys
+# are matched by provider prefix (OpenAI, AWS, GitHub) rather than any long
+# alnum run.
+_PII_SOURCES = {
     'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
     'ssn': r'\b\d{3}-\d{2}-\d{4}\b',
     'credit_card': r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b',
     'phone': r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
     'ip_address': r'\b(?:\d{1,3}\.){3}\d{1,3}\b',
-    'api_key': r'\b[A-Za-z0-9_-]{32,}\b',
+    'api_key': r'\b(?:sk-[A-Za-z0-9]{32,}|AKIA[0-9A-Z]{16}|ghp_[A-Za-z0-9]{36})\b',
 }
 
+# Compiled once at import
+PII_PATTERNS = {name: re.compile(source) for name, source in _PII_SOURCES.items()}
+
+# All PII types in one alternation; match.lastgroup names the type that matched.
+# Scanned with RE2 when available (and in agreement with re) so untrusted text
+# stays linear-time.
+_COMBINED_PII = ScanPattern("|".join(f"(?P<{name}>{source})" for name, source in _PII_SOURCES.items()))
+
+# Every PII type except API keys needs a digit or '@', so text without either
+# only has to be scanned for keys. Only worth it on the backtracking engine:
+# RE2 already runs the whole alternation as one DFA pass.
+_PII_TRIGGER_RE = re.compile(r'[\d@]')
+_UNTRIGGERED_PII = re.compile(f"(?P<api_key>{_PII_SOURCES['api_key']})")
+
+# Prompt injection patterns as (pattern, reason); reasons double as group names
+_INJECTION_SOURCES = [
+    (r'ignore\s+(?:all\s+)?previous\s+instructions?', 'instruction_override'),
+    (r'reveal\s+(?:password|credential|secret|token|key)', 'credential_request'),
+    (r'(?:admin|root|system)\s+(?:password|credential|access)', 'privilege_escalation'),
+    (r'<script|javascript:', 'xss_attempt'),
+    (r'(?:union\s+select|drop\s+table|delete\s+from)', 'sql_injection'),
+    (r'(?:tell|show)\s+me\s+(?:anything|everything)\s+about', 'data_exfiltration'),
+    (r'bypass\s+(?:security|policy|restriction|limit)', 'security_bypass'),
+    (r'\$\{.*\}|%\{.*\}', 'template_injection'),
+]
+
+# One case-insensitive alternation; match.lastgroup is the reason. Kept on the
+# stdlib engine so \s also matches Unicode whitespace (e.g. NBSP) in prompts.
+_INJECTION_RE = re.compile(
+    "|".join(f"(?P<{reason}>{pattern})" for pattern, reason in _INJECTION_SOURCES),
+    re.IGNORECASE
+)
+
+# Authentication token patterns, most specific first in one alternation so
+# each token is reported once rather than once per overlapping pattern
+_TOKEN_RE = ScanPattern("|".join([
+    r'Bearer\s+[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+',  # JWT
+    r'sk-[A-Za-z0-9]{32,}',  # API keys
+    r'[A-Za-z0-9_-]{40,}',  # Generic long tokens
+]))
+
+
+@lru_cache(maxsize=1024)
+def _scan_pii(text: str) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    Scan text for PII once and return (type, start, end) spans in order.
+    
+    Cached so the check -> detail -> redact sequence on one payload only
+    scans it once.
+    """
+    pattern = _COMBINED_PII.select(text)
+    if pattern is _COMBINED_PII.pattern and not _PII_TRIGGER_RE.search(text):
+        pattern = _UNTRIGGERED_PII
+    
+    return tuple(
+        (match.lastgroup, match.start(), match.end())
+        for match in pattern.finditer(text)
+    )
+
 
 def contains_pii(text: str) -> bool:
     """
@@ -32,11 +104,7 @@ def contains_pii(text: str) -> bool:
     if not text:
         return False
     
-    for pattern_name, pattern in PII_PATTERNS.items():
-        if re.search(pattern, text):
-            return True
-    
-    return False
+    return bool(_scan_pii(text))
 
 
 def detect_pii_detailed(text: str) -> List[Dict[str, Any]]:
@@ -47,22 +115,18 @@ def detect_pii_detailed(text: str) -> List[Dict[str, Any]]:
         text: Text to analyze
         
     Returns:
-        List of PII findings with type and redacted value
+        List of PII findings with type and redacted value, in order of appearance
     """
-    findings = []
-    
-    for pattern_name, pattern in PII_PATTERNS.items():
-        matches = re.finditer(pattern, text)
-        for match in matches:
-            findings.append({
-                'type': pattern_name,
-                'value': match.group(0),
-                'start': match.start(),
-                'end': match.end(),
-                'redacted': redact_sensitive_data(match.group(0))
-            })
-    
-    return findings
+    return [
+        {
+            'type': pii_type,
+            'value': text[start:end],
+            'start': start,
+            'end': end,
+            'redacted': f'[REDACTED_{pii_type.upper()}]'
+        }
+        for pii_type, start, end in _scan_pii(text)
+    ]
 
 
 def redact_sensitive_data(text: str) -> str:
@@ -75,10 +139,39 @@ def redact_sensitive_data(text: str) -> str:
     Returns:
         Redacted text
     """
-    for pattern_name, pattern in PII_PATTERNS.items():
-        text = re.sub(pattern, f'[REDACTED_{pattern_name.upper()}]', text)
+    # Stitch the untouched gaps and labels together from the scanned offsets
+    parts = []
+    position = 0
+    for pii_type, start, end in _scan_pii(text):
+        parts.append(text[position:start])
+        parts.append(f'[REDACTED_{pii_type.upper()}]')
+        position = end
+    parts.append(text[position:])
     
-    return text
+    return ''.join(parts)
+
+
+def detect_pii_batch(texts: Iterable[str], n_process: int = 1) -> List[List[Dict[str, Any]]]:
+    """
+    Detect PII findings for many texts at once.
+    
+    Args:
+        texts: Texts to analyze
+        n_process: Number of worker processes; 1 scans in this process
+        
+    Returns:
+        One list of findings per text (see detect_pii_detailed), in input order
+    """
+    texts = list(texts)
+    
+    if n_process <= 1 or len(texts) < 2:
+        return [detect_pii_detailed(text) for text in texts]
+    
+    # Hand each worker several texts per round trip to amortize the IPC cost;
+    # workers scan with their own module-level compiled pattern
+    chunksize = max(1, len(texts) // (n_process * 4))
+    with ProcessPoolExecutor(max_workers=n_process) as executor:
+        return list(executor.map(detect_pii_detailed, texts, chunksize=chunksize))
 
 
 def check_prompt_injection(prompt: str) -> Tuple[bool, str]:
@@ -89,36 +182,24 @@ def check_prompt_injection(prompt: str) -> Tuple[bool, str]:
         prompt: User prompt to check
         
     Returns:
-        Tuple of (is_malicious, reason)
+        Tuple of (is_malicious, reason); the reason is that of the earliest
+        injection attempt in the prompt
     """
-    # Injection patterns
-    injection_patterns = [
-        (r'ignore\s+(all\s+)?previous\s+instructions?', 'instruction_override'),
-        (r'reveal\s+(password|credential|secret|token|key)', 'credential_request'),
-        (r'(admin|root|system)\s+(password|credential|access)', 'privilege_escalation'),
-        (r'<script|javascript:', 'xss_attempt'),
-        (r'(union\s+select|drop\s+table|delete\s+from)', 'sql_injection'),
-        (r'(tell|show)\s+me\s+(anything|everything)\s+about', 'data_exfiltration'),
-        (r'bypass\s+(security|policy|restriction|limit)', 'security_bypass'),
-        (r'\$\{.*\}|%\{.*\}', 'template_injection'),
-    ]
-    
-    prompt_lower = prompt.lower()
-    
-    for pattern, reason in injection_patterns:
-        if re.search(pattern, prompt_lower):
-            return True, reason
+    match = _INJECTION_RE.search(prompt)
+    if match:
+        return True, match.lastgroup
     
     return False, "safe"
 
 
-def validate_model_access(model_id: str, allowed_models: List[str]) -> bool:
+def validate_model_access(model_id: str, allowed_models: Container[str]) -> bool:
     """
     Validate if model access is allowed.
     
     Args:
         model_id: Model identifier being accessed
-        allowed_models: List of allowed model IDs
+        allowed_models: Allowed model IDs; pass a set/frozenset built once for
+            O(1) lookups on hot paths (lists still work, with a linear scan)
         
     Returns:
         True if access is allowed
@@ -126,35 +207,71 @@ def validate_model_access(model_id: str, allowed_models: List[str]) -> bool:
     return model_id in allowed_models
 
 
-def check_data_leakage(training_data: List[str], test_data: List[str]) -> Dict[str, Any]:
+def check_data_leakage(
+    training_data: Iterable[str],
+    test_data: Iterable[str],
+    test_is_smaller: bool = True
+) -> Dict[str, Any]:
     """
     Check for data leakage between training and test sets.
     
+    Both sides are consumed once, so generators over out-of-core datasets
+    work; only the smaller side is held in memory.
+    
     Args:
         training_data: Training dataset samples
         test_data: Test dataset samples
+        test_is_smaller: Whether the test side is the smaller one to hold in
+            memory; pass False when the training set is smaller
         
     Returns:
         Leakage analysis results
     """
-    # Create hashes for faster comparison
-    training_hashes = {hashlib.md5(sample.encode()).hexdigest() for sample in training_data}
-    test_hashes = {hashlib.md5(sample.encode()).hexdigest() for sample in test_data}
+    if test_is_smaller:
+        held_data, streamed_data = test_data, training_data
+    else:
+        held_data, streamed_data = training_data, test_data
+    
+    held = set()
+    held_total = 0
+    for sample in held_data:
+        held.add(sample)
+        held_total += 1
+    
+    # Find duplicates while streaming the larger side
+    duplicates = set()
+    streamed_total = 0
+    for sample in streamed_data:
+        if sample in held:
+            duplicates.add(sample)
+        streamed_total += 1
     
-    # Find duplicates
-    duplicates = training_hashes.intersection(test_hashes)
+    total_test, total_training = (
+        (held_total, streamed_total) if test_is_smaller else (streamed_total, held_total)
+    )
     leakage_count = len(duplicates)
-    leakage_ratio = leakage_count / len(test_data) if test_data else 0
+    leakage_ratio = leakage_count / total_test if total_test else 0
     
     return {
         'has_leakage': leakage_count > 0,
         'leakage_count': leakage_count,
         'leakage_ratio': leakage_ratio,
-        'total_training': len(training_data),
-        'total_test': len(test_data)
+        'total_training': total_training,
+        'total_test': total_test
     }
 
 
+# bincount widens its input to intp, so large buffers are histogrammed in
+# chunks of this many bytes to bound the temporary
+_ENTROPY_CHUNK_SIZE = 1024 * 1024
+
+# Buffers above this size are first judged on a few sampled windows
+_ENTROPY_SAMPLE_MIN_SIZE = 64 * 1024
+_ENTROPY_WINDOW_SIZE = 4096
+# Sampled entropy inside this band is too close to the threshold to trust
+_ENTROPY_AMBIGUOUS_BAND = (7.3, 7.7)
+
+
 def validate_encryption(data: bytes, expected_algorithm: str = 'AES-256') -> bool:
     """
     Validate that data appears to be properly encrypted.
@@ -169,6 +286,22 @@ def validate_encryption(data: bytes, expected_algorithm: str = 'AES-256') -> boo
     if not data:
         return False
     
+    # Large buffers: estimate from the start, middle and end windows and only
+    # scan everything when the estimate lands near the threshold
+    if len(data) > _ENTROPY_SAMPLE_MIN_SIZE:
+        view = memoryview(data)
+        middle = len(data) // 2
+        sample = b''.join((
+            view[:_ENTROPY_WINDOW_SIZE],
+            view[middle:middle + _ENTROPY_WINDOW_SIZE],
+            view[-_ENTROPY_WINDOW_SIZE:]
+        ))
+        sampled_entropy = calculate_entropy(sample)
+        
+        low, high = _ENTROPY_AMBIGUOUS_BAND
+        if not low <= sampled_entropy <= high:
+            return sampled_entropy > 7.5
+    
     # Check entropy (encrypted data should have high entropy)
     entropy = calculate_entropy(data)
     
@@ -189,21 +322,24 @@ def calculate_entropy(data: bytes) -> float:
     if not data:
         return 0.0
     
-    # Count byte frequencies
-    byte_counts = [0] * 256
-    for byte in data:
-        byte_counts[byte] += 1
-    
-    # Calculate entropy
-    entropy = 0.0
-    data_len = len(data)
+    if np is None:
+        # Counter tallies the byte values in C; memoryviews need copying first
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        length = len(data)
+        return sum(
+            (count / length) * math.log2(length / count)
+            for count in Counter(data).values()
+        )
     
-    for count in byte_counts:
-        if count > 0:
-            probability = count / data_len
-            entropy -= probability * (probability.bit_length() - 1)
+    # Byte histogram in C, accumulated chunk by chunk
+    values = np.frombuffer(data, dtype=np.uint8)
+    counts = np.zeros(256, dtype=np.int64)
+    for offset in range(0, len(values), _ENTROPY_CHUNK_SIZE):
+        counts += np.bincount(values[offset:offset + _ENTROPY_CHUNK_SIZE], minlength=256)
+    probabilities = counts[counts > 0] / len(data)
     
-    return entropy
+    return float(np.sum(probabilities * np.log2(1 / probabilities)))
 
 
 def check_token_exposure(text: str) -> List[str]:
@@ -214,21 +350,37 @@ def check_token_exposure(text: str) -> List[str]:
         text: Text to scan
         
     Returns:
-        List of potentially exposed tokens
+        List of unique potentially exposed tokens, in order of appearance
     """
-    token_patterns = [
-        r'Bearer\s+[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+',  # JWT
-        r'sk-[A-Za-z0-9]{32,}',  # API keys
-        r'[A-Za-z0-9_-]{40,}',  # Generic long tokens
-    ]
-    
-    exposed_tokens = []
+    return list(dict.fromkeys(_TOKEN_RE.findall(text)))
+
+
+# Checks for the guardrails with a dedicated response indicator; any other
+# guardrail counts as present when the response has a key of the same name
+_GUARDRAIL_CHECKS = {
+    'content_filter': lambda response: response.get("content_filtered", False) or
+                                       response.get("safety_check", False),
+    'rate_limit': lambda response: "rate_limit" in response or "x-rate-limit" in response,
+    'audit_log': lambda response: response.get("audit_logged", False) or
+                                  response.get("request_id") is not None,
+}
+
+
+@lru_cache(maxsize=32)
+def _make_guardrail_checker(
+    required_guardrails: Tuple[str, ...]
+) -> Callable[[Dict[str, Any]], Dict[str, bool]]:
+    """Resolve the check for each required guardrail once per guardrail set."""
+    checks = tuple(
+        (guardrail, _GUARDRAIL_CHECKS.get(guardrail) or
+         (lambda response, key=guardrail: key in response))
+        for guardrail in required_guardrails
+    )
     
-    for pattern in token_patterns:
-        matches = re.findall(pattern, text)
-        exposed_tokens.extend(matches)
+    def check(response: Dict[str, Any]) -> Dict[str, bool]:
+        return {guardrail: validate(response) for guardrail, validate in checks}
     
-    return exposed_tokens
+    return check
 
 
 def validate_guardrails(response: Dict[str, Any], required_guardrails: List[str]) -> Dict[str, bool]:
@@ -242,18 +394,4 @@ def validate_guardrails(response: Dict[str, Any], required_guardrails: List[str]
     Returns:
         Dictionary mapping guardrail names to validation status
     """
-    results = {}
-    
-    for guardrail in required_guardrails:
-        if guardrail == "content_filter":
-            results[guardrail] = response.get("content_filtered", False) or \
-                                response.get("safety_check", False)
-        elif guardrail == "rate_limit":
-            results[guardrail] = "rate_limit" in response or "x-rate-limit" in response
-        elif guardrail == "audit_log":
-            results[guardrail] = response.get("audit_logged", False) or \
-                                response.get("request_id") is not None
-        else:
-            results[guardrail] = guardrail in response
-    
-    return results
+    return _make_guardrail_checker(tuple(required_guardrails))(response)
@@ -1,21 +1,29 @@
 class ThreatSummarizer:
     """AI-powered threat report summarization"""
     
+    __slots__ = ()
+    
     def summarize(self, text, max_length=100):
         """Summarize threat report"""
-        # Simple extractive summarization (first sentences)
-        sentences = text.split('. ')
+        # Simple extractive summarization (first sentences). Every kept sentence
+        # adds at least its '. ' separator, so at most max_length // 2 + 1 fit;
+        # splitting once more than that leaves the unused tail unsplit.
+        sentences = text.split('. ', max(max_length // 2 + 1, 0))
         
-        summary = ''
+        parts = []
+        summary_length = 0
         for sentence in sentences:
-            if len(summary) + len(sentence) <= max_length:
-                summary += sentence + '. '
+            if summary_length + len(sentence) <= max_length:
+                parts.append(sentence)
+                summary_length += len(sentence) + 2
             else:
                 break
         
+        summary = '. '.join(parts) + '. ' if parts else ''
+        
         return {
             'original_length': len(text),
             'summary': summary.strip(),
-            'summary_length': len(summary),
-            'compression_ratio': round(len(summary) / len(text), 2)
+            'summary_length': summary_length,
+            'compression_ratio': round(summary_length / len(text), 2)
         }
\ No newline at end of file
@@ -1,26 +1,67 @@
+import re
+from typing import ClassVar, Pattern, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # Optional automaton, fall back to a single regex scan
+    ahocorasick = None
+
+
+def _build_keyword_automaton(categories):
+    """Build one Aho-Corasick automaton mapping every keyword to its label."""
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for label, _, keywords in categories:
+        for keyword in keywords:
+            automaton.add_word(keyword, label)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_keyword_regex(categories):
+    """Build one case-insensitive regex with a named group per label."""
+    # Keywords are plain substrings, so a lookahead reports overlapping hits
+    # (e.g. "installimited offer") just like the automaton does
+    return re.compile(
+        '(?=' + '|'.join(
+            f"(?P<{label}>{'|'.join(map(re.escape, keywords))})"
+            for label, _, keywords in categories
+        ) + ')',
+        re.IGNORECASE
+    )
+
+
 class ThreatClassifier:
     """AI threat classification"""
     
+    # Stateless: the keyword tables below are built once at import and shared
+    __slots__ = ()
+    
+    # (label, confidence, keywords) in the order labels are reported
+    _CATEGORIES: ClassVar[Tuple[Tuple[str, float, Tuple[str, ...]], ...]] = (
+        ('phishing', 0.92, ('click here', 'claim prize', 'urgent', 'verify account')),
+        ('malware', 0.88, ('download', 'attachment', 'install', 'exe')),
+        ('spam', 0.75, ('buy now', 'limited offer', 'act fast')),
+    )
+    _KEYWORD_AUTOMATON: ClassVar[object] = _build_keyword_automaton(_CATEGORIES)
+    _KEYWORD_RE: ClassVar[Pattern] = _build_keyword_regex(_CATEGORIES)
+    
     def classify(self, text):
         """Classify threat type from text"""
-        text_lower = text.lower()
+        # Single pass over the text collecting every label whose keyword appears
+        if self._KEYWORD_AUTOMATON is not None:
+            matched = {label for _, label in self._KEYWORD_AUTOMATON.iter(text.lower())}
+        else:
+            matched = {match.lastgroup for match in self._KEYWORD_RE.finditer(text)}
+        
         labels = []
         confidence = []
-        
-        # Check for phishing
-        if any(word in text_lower for word in ['click here', 'claim prize', 'urgent', 'verify account']):
-            labels.append('phishing')
-            confidence.append(0.92)
-        
-        # Check for malware
-        if any(word in text_lower for word in ['download', 'attachment', 'install', 'exe']):
-            labels.append('malware')
-            confidence.append(0.88)
-        
-        # Check for spam
-        if any(word in text_lower for word in ['buy now', 'limited offer', 'act fast']):
-            labels.append('spam')
-            confidence.append(0.75)
+        for label, score, _ in self._CATEGORIES:
+            if label in matched:
+                labels.append(label)
+                confidence.append(score)
         
         return {
             'text': text,
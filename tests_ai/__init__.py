@@ -1,3 +1,3 @@
 """AI test modules."""
 
-__all__ = ['test_llm_guardrails', 'test_summarization', 'test_classification', 'test_autofill']
+__all__ = ['test_llm_guardrails', 'test_summarization', 'test_classification', 'test_autofill', 'test_security_checks', 'test_metrics']
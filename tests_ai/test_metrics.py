@@ -0,0 +1,27 @@
+import numpy as np
+
+from core import metrics
+from core.metrics import semantic_similarity_batch, token_overlap_similarity
+
+
+def _missing_model():
+    raise ImportError("sentence-transformers not installed")
+
+
+def test_semantic_similarity_batch_fallback(monkeypatch):
+    """Test batch similarity falls back to token overlap per pair, in order"""
+    monkeypatch.setattr(metrics, '_load_embedding_model', _missing_model)
+    pairs = [
+        ("phishing email detected", "phishing email detected"),
+        ("malware attachment", "spam offer"),
+        ("urgent verify account", "verify your account"),
+    ]
+    
+    scores = semantic_similarity_batch(pairs)
+    
+    assert scores.shape == (3,)
+    assert np.allclose(scores, [token_overlap_similarity(a, b) for a, b in pairs])
+    assert scores[0] == 1.0 and scores[1] == 0.0
+    
+    # Empty input
+    assert semantic_similarity_batch([]).shape == (0,)
\ No newline at end of file
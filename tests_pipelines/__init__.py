@@ -1,3 +1,3 @@
 """Pipeline test modules."""
 
-__all__ = ['test_data_pipelines', 'test_anomaly_detection', 'test_integration_ml']
+__all__ = ['test_data_pipelines', 'test_anomaly_detection', 'test_integration_ml', 'test_helpers', 'test_api_client', 'test_logger']
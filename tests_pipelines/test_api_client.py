@@ -0,0 +1,54 @@
+import http.server
+import json
+import threading
+
+import pytest
+import requests
+
+from core.api_client import APIClient
+
+
+class _EchoHandler(http.server.BaseHTTPRequestHandler):
+    """Reply to POSTs with the decoded request body and to GETs with plain text"""
+    
+    def _reply(self, out):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+    
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self._reply(json.dumps({'received': json.loads(body)}).encode())
+    
+    def do_GET(self):
+        self._reply(b'<html>not json</html>')
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def client():
+    """API client pointed at a local echo server."""
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _EchoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    with APIClient(f"http://127.0.0.1:{server.server_port}", "test-token") as api_client:
+        yield api_client
+    
+    server.shutdown()
+
+
+def test_post_payload_with_big_integer(client):
+    """Test integers beyond 64 bits are sent and returned exactly"""
+    result = client.post("/echo", {'v': 2 ** 70})
+    assert result == {'received': {'v': 2 ** 70}}
+
+
+def test_non_json_response_raises_request_exception(client):
+    """Test a 200 response with a non-JSON body raises requests' JSONDecodeError"""
+    with pytest.raises(requests.exceptions.JSONDecodeError) as excinfo:
+        client.get("/page")
+    
+    assert isinstance(excinfo.value, requests.RequestException)
\ No newline at end of file
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import pytest
+
+from core.helpers import (
+    batch_list,
+    batch_slices,
+    fuzzy_match,
+    fuzzy_match_batch,
+    parse_json_safe,
+    parse_timestamp
+)
+
+
+def test_parse_json_safe_matches_stdlib():
+    """Test JSON parsing keeps big integers exact and accepts NaN like json.loads"""
+    assert parse_json_safe('{"a": 123456789012345678901234567890}') == {'a': 123456789012345678901234567890}
+    assert parse_json_safe(b'{"id": 42, "ok": true}') == {'id': 42, 'ok': True}
+    
+    result = parse_json_safe('[NaN]')
+    assert len(result) == 1 and result[0] != result[0]
+    
+    # Invalid input
+    assert parse_json_safe('not json', default={}) == {}
+
+
+def test_parse_timestamp_supported_formats():
+    """Test timestamps parse to naive datetimes only in the supported formats"""
+    assert parse_timestamp('2024-01-01 10:00:00') == datetime(2024, 1, 1, 10, 0, 0)
+    assert parse_timestamp('2024-01-01T10:00:00.5Z') == datetime(2024, 1, 1, 10, 0, 0, 500000)
+    assert parse_timestamp('2024-01-01T10:00:00.123456') == datetime(2024, 1, 1, 10, 0, 0, 123456)
+    
+    # Offsets, date-only and other ISO-8601 shapes are not supported
+    for unsupported in ('2024-01-01T10:00:00+05:00', '2024-01-01', '20240101', '2024-01-01T10', '2024-01-01T24:00:00'):
+        assert parse_timestamp(unsupported) is None
+
+
+def test_fuzzy_match_batch_agrees_with_fuzzy_match():
+    """Test the batch matrix matches fuzzy_match pair by pair, even at the threshold"""
+    queries = ['abcdefg', 'threat report', 'phishing']
+    choices = ['abcxxxx', 'threat reprot', 'malware']
+    threshold = 3 / 7
+    
+    matches = fuzzy_match_batch(queries, choices, threshold)
+    assert matches.shape == (3, 3)
+    assert matches[0, 0]
+    
+    for i, query in enumerate(queries):
+        for j, choice in enumerate(choices):
+            assert matches[i, j] == fuzzy_match(query, choice, threshold)
+
+
+def test_batching_helpers():
+    """Test batches come out in order and bad sizes fail at the call"""
+    assert list(batch_list(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(batch_list(iter([]), 2)) == []
+    assert list(batch_slices('abcdefg', 3)) == ['abc', 'def', 'g']
+    assert list(batch_slices((1, 2, 3, 4), 2)) == [(1, 2), (3, 4)]
+    
+    # Raised before any iteration
+    with pytest.raises(ValueError):
+        batch_list([1, 2], 0)
+    with pytest.raises(ValueError):
+        batch_slices([1, 2], -1)
\ No newline at end of file
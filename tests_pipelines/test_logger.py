@@ -0,0 +1,28 @@
+import json
+import logging
+
+import numpy as np
+
+from core.logger import JSONFormatter, get_logger, log_metric
+
+
+def test_log_metric_numpy_values_and_int_keys(caplog):
+    """Test metrics with NumPy values and int metadata keys are logged as JSON"""
+    logger = get_logger("tests.metrics")
+    
+    with caplog.at_level(logging.INFO, logger="tests.metrics"):
+        log_metric(logger, "precision", np.float64(0.875), {1: "fold", "counts": np.array([3, 4])})
+    
+    payload = json.loads(caplog.records[-1].getMessage().split("METRIC: ", 1)[1])
+    assert payload["value"] == 0.875
+    assert payload["1"] == "fold"
+    assert payload["counts"] == [3, 4]
+    assert payload["timestamp"].endswith("Z")
+
+
+def test_json_formatter_extra_data():
+    """Test structured log records serialize NumPy extra data"""
+    record = logging.LogRecord("tests", logging.INFO, __file__, 1, "scored", None, None)
+    record.extra_data = {2: np.int64(7)}
+    
+    assert json.loads(JSONFormatter().format(record))["extra"] == {"2": 7}
\ No newline at end of file